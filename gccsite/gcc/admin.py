@@ -1,11 +1,9 @@
 # Copyright (C) <2019> Association Prologin <association@prologin.org>
 # SPDX-License-Identifier: GPL-3.0+
 
-import csv
 import datetime
 
 from adminsortable.admin import SortableTabularInline, NonSortableParentAdmin
-from django.http import HttpResponse
 from django.db.models import Q
 from django.contrib import admin
 from django.utils.translation import ugettext_lazy as _
@@ -24,43 +22,16 @@ Snippet from https://books.agiliq.com/projects/django-admin-cookbook/en/latest/e
 Exports data into CSV, useful for giving data back to users and exploiting big
 amount of datas in dedicated softs
 
-The model must implement get_export_data methods
+The model must implement get_export_fieldnames and iter_export_rows methods
 """
 
 
 class ExportCsvMixin:
     def export_as_csv(self, request, queryset, filename=None):
-
-        mod = self.model
-        meta = mod._meta
-        fieldnames = []
-
-        all_keys = set()
-
-        datas = []
-
-        # check all the cols names and perform SQL queries
-        for obj in queryset:
-            data = obj.get_export_data()
-            datas.append(data)
-
-            for key in data:
-                if key not in all_keys:
-                    fieldnames.append(key)
-                    all_keys.add(key)
-
-        # create the response
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename={}.csv'.format(
-            meta if filename is None else filename
+        return export_queryset_as_csv(
+            queryset,
+            str(self.model._meta) if filename is None else filename,
         )
-        writer = csv.DictWriter(response, fieldnames=fieldnames)
-        writer.writeheader()
-
-        for data in datas:
-            row = writer.writerow(data)
-
-        return response
 
     export_as_csv.short_description = "Export selected as csv"
 
@@ -120,6 +91,7 @@ class ApplicationStatusFilter(admin.SimpleListFilter):
 @admin.register(models.Applicant)
 class ApplicationAdmin(admin.ModelAdmin, ExportCsvMixin):
     models.Applicant.get_status_display.short_description = _('status')
+    models.Applicant.get_status_display.admin_order_field = 'status_rank'
 
     search_fields = [
         'user__username',
@@ -143,6 +115,9 @@ class ApplicationAdmin(admin.ModelAdmin, ExportCsvMixin):
 
     actions = ["export_as_csv"]
 
+    def get_queryset(self, request):
+        return models.Applicant.with_status_rank(super().get_queryset(request))
+
 
 # -- Event
 
@@ -164,36 +139,39 @@ class EventAdmin(admin.ModelAdmin):
     list_filter = ['edition', 'center']
     inlines = [CorrectorInline]
 
+    def export_applicants_as_csv(self, queryset, statuses, name):
+        applicants = models.Applicant.objects.filter(
+            eventwish__event__in=queryset, eventwish__status__in=statuses
+        ).distinct()
+        return export_queryset_as_csv(
+            applicants,
+            '_'.join([name] + [event.csv_name() for event in queryset]),
+        )
+
     def incomplete_export_as_csv(self, request, queryset):
-        participants = []
-        for obj in queryset:
-            participants += models.Applicant.incomplete_applicants_for(obj)
-            return export_queryset_as_csv(
-                participants, 'incomplete' + '_' + obj.csv_name()
-            )
+        return self.export_applicants_as_csv(
+            queryset,
+            [models.ApplicantStatusTypes.incomplete.value],
+            'incomplete',
+        )
 
-            incomplete_export_as_csv.short_description = (
-                "Export incomplete as csv"
-            )
+    incomplete_export_as_csv.short_description = "Export incomplete as csv"
 
     def pending_export_as_csv(self, request, queryset):
-        participants = []
-        for obj in queryset:
-            participants += models.Applicant.acceptable_applicants_for(obj)
-            return export_queryset_as_csv(
-                participants, 'pending' + '_' + obj.csv_name()
-            )
+        return self.export_applicants_as_csv(
+            queryset, [models.ApplicantStatusTypes.selected.value], 'pending'
+        )
 
-            pending_export_as_csv.short_description = "Export pending as csv"
+    pending_export_as_csv.short_description = "Export pending as csv"
 
     def accepted_and_confirmed_export_as_csv(self, request, queryset):
-        participants = []
-        for obj in queryset:
-            participants += models.Applicant.accepted_applicants_for(
-                obj
-            ) + models.Applicant.confirmed_applicants_for(obj)
-        return export_queryset_as_csv(
-            participants, 'accepted_and_confirmed' + '_' + obj.csv_name()
+        return self.export_applicants_as_csv(
+            queryset,
+            [
+                models.ApplicantStatusTypes.accepted.value,
+                models.ApplicantStatusTypes.confirmed.value,
+            ],
+            'accepted_and_confirmed',
         )
 
     accepted_and_confirmed_export_as_csv.short_description = (
@@ -201,11 +179,8 @@ class EventAdmin(admin.ModelAdmin):
     )
 
     def rejected_export_as_csv(self, request, queryset):
-        participants = []
-        for obj in queryset:
-            participants += models.Applicant.rejected_applicants_for(obj)
-        return export_queryset_as_csv(
-            participants, 'rejected' + '_' + obj.csv_name()
+        return self.export_applicants_as_csv(
+            queryset, [models.ApplicantStatusTypes.rejected.value], 'rejected'
         )
 
     rejected_export_as_csv.short_description = "Export rejected as csv"
@@ -6,3 +6,7 @@ from django.apps import AppConfig
 
 class GccConfig(AppConfig):
     name = 'gcc'
+
+    def ready(self):
+        # Connect the cache invalidation receivers
+        import gcc.signals  # noqa: F401
@@ -1,33 +1,49 @@
 import csv
+import itertools
 
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
 
 
-def export_queryset_as_csv(queryset, filename):
-    fieldnames = []
+class Echo:
+    """
+    Pseudo-buffer implementing only the write method of the file interface,
+    the csv writer then just returns the lines it would have written.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_queryset_by_chunks(queryset, chunk_size=500):
+    """
+    Iterate over a queryset without loading all the objects at once.
 
-    all_keys = set()
+    Unlike QuerySet.iterator(), prefetch_related() lookups are still honored
+    as each chunk is evaluated as a separate queryset.
+    """
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
 
-    datas = []
+    for start in range(0, len(pks), chunk_size):
+        chunk = pks[start : start + chunk_size]
+        yield from queryset.filter(pk__in=chunk).order_by('pk')
 
-    # check all the cols names and perform SQL queries
-    for obj in queryset:
-        data = obj.get_export_data()
-        datas.append(data)
-        for key in data:
-            if key not in all_keys:
-                fieldnames.append(key)
-                all_keys.add(key)
 
-    # create the response
-    response = HttpResponse(content_type='text/csv')
+def export_queryset_as_csv(queryset, filename):
+    """
+    Stream a queryset as a csv file, its model must implement the
+    get_export_fieldnames and iter_export_rows class methods.
+    """
+    model = queryset.model
+    fieldnames = model.get_export_fieldnames(queryset)
+    writer = csv.DictWriter(Echo(), fieldnames=fieldnames)
+
+    header = dict(zip(fieldnames, fieldnames))
+    rows = itertools.chain([header], model.iter_export_rows(queryset))
+
+    response = StreamingHttpResponse(
+        (writer.writerow(row) for row in rows), content_type='text/csv'
+    )
     response['Content-Disposition'] = (
         'attachment; filename=' + filename + '.csv'
     )
-    writer = csv.DictWriter(response, fieldnames=fieldnames)
-    writer.writeheader()
-
-    for data in datas:
-        row = writer.writerow(data)
-
     return response
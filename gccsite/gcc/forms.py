@@ -89,8 +89,8 @@ def build_dynamic_form(form, user, edition):
                 elif question.response_type == AnswerTypes.multichoice.value:
                     self.fields[field_id] = forms.ChoiceField(
                         choices=[
-                            (str(choice), question.meta['choices'][choice])
-                            for choice in question.meta['choices'].keys()
+                            (str(choice), label)
+                            for choice, label in question.choices.items()
                         ],
                         **basic_args,
                     )
@@ -244,15 +244,17 @@ class ApplicationWishesForm(forms.Form):
             ~Q(status=ApplicantStatusTypes.incomplete.value),
             applicant__user=user,
             event__edition=edition,
+        ).values('event_id')
+
+        now = timezone.now()
+        events = (
+            Event.objects.filter(
+                signup_start__lt=now, signup_end__gt=now, edition=edition
+            )
+            .exclude(pk__in=tried_for)
+            .select_related('center')
+            .order_by('event_start')
         )
-        tried_for = set(wish.event for wish in tried_for)
-
-        events = Event.objects.filter(
-            signup_start__lt=timezone.now(),
-            signup_end__gt=timezone.now(),
-            edition=edition,
-        ).order_by('event_start')
-        events = [event for event in events if event not in tried_for]
 
         # Get a list of (primary_key, event name) for the selectors
         events_selection = [(None, '')] + [
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [('gcc', '0008_event_is_long')]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(
+                fields=['edition', 'signup_start', 'signup_end'],
+                name='gcc_event_signup_idx',
+            ),
+        )
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [('gcc', '0009_event_signup_index')]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventwish',
+            index=models.Index(
+                fields=['event', 'status'], name='gcc_eventwish_event_status'
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='eventwish',
+            index=models.Index(
+                fields=['applicant', 'status'],
+                name='gcc_eventwish_appl_status',
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+
+# Value of ApplicantStatusTypes.accepted
+ACCEPTED = 4
+
+
+def assignations_to_wishes(apps, schema_editor):
+    """
+    Create an accepted wish for the deprecated assignations which don't have
+    a matching wish yet.
+    """
+    Applicant = apps.get_model('gcc', 'Applicant')
+    EventWish = apps.get_model('gcc', 'EventWish')
+    Assignation = Applicant.assignation_event.through
+
+    for assignation in Assignation.objects.all():
+        wishes = EventWish.objects.filter(applicant=assignation.applicant_id)
+
+        if not wishes.filter(event=assignation.event_id).exists():
+            EventWish.objects.create(
+                applicant_id=assignation.applicant_id,
+                event_id=assignation.event_id,
+                status=ACCEPTED,
+                order=wishes.count() + 1,
+            )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [('gcc', '0010_eventwish_status_indexes')]
+
+    operations = [
+        migrations.RunPython(
+            assignations_to_wishes, migrations.RunPython.noop
+        ),
+        migrations.RemoveField(
+            model_name='applicant', name='assignation_event'
+        ),
+    ]
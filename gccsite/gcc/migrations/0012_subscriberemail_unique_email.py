@@ -0,0 +1,31 @@
+from django.db import migrations, models
+
+
+def remove_duplicate_subscribers(apps, schema_editor):
+    """
+    Only keep the oldest subscription of each email address.
+    """
+    SubscriberEmail = apps.get_model('gcc', 'SubscriberEmail')
+    seen = set()
+
+    for subscriber in SubscriberEmail.objects.order_by('date', 'pk'):
+        if subscriber.email in seen:
+            subscriber.delete()
+        else:
+            seen.add(subscriber.email)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [('gcc', '0011_remove_applicant_assignation_event')]
+
+    operations = [
+        migrations.RunPython(
+            remove_duplicate_subscribers, migrations.RunPython.noop
+        ),
+        migrations.AlterField(
+            model_name='subscriberemail',
+            name='email',
+            field=models.EmailField(max_length=254, unique=True),
+        ),
+    ]
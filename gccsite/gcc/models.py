@@ -3,14 +3,13 @@
 
 import hashlib
 import os
-from collections import OrderedDict
 from datetime import date
 
 from django.conf import settings
 from django.contrib.postgres.fields import JSONField
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
-from django.db.models import Q
+from django.db.models import Case, Count, Max, Value, When
 from django.urls import reverse
 from django.utils.formats import date_format
 from django.utils import timezone
@@ -19,6 +18,7 @@ from django.utils.translation import ugettext_noop
 
 from adminsortable.models import SortableMixin
 from centers.models import Center
+from gcc.export import iter_queryset_by_chunks
 from prologin.models import AddressableModel, ContactModel, EnumField
 from prologin.utils import ChoiceEnum, upload_path
 
@@ -60,11 +60,12 @@ class Edition(models.Model):
 
     def subscription_is_open(self):
         """Is there still one event open for subscription"""
+        now = timezone.now()
         current_events = Event.objects.filter(
             edition=self,
-            signup_start__lt=timezone.now(),
-            signup_end__gte=timezone.now(),
-            event_end__gt=timezone.now(),
+            signup_start__lt=now,
+            signup_end__gte=now,
+            event_end__gt=now,
         )
         return current_events.exists()
 
@@ -131,6 +132,14 @@ class Event(models.Model):
                 'Event start date cannot precede signup end date'
             )
 
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['edition', 'signup_start', 'signup_end'],
+                name='gcc_event_signup_idx',
+            )
+        ]
+
 
 class Corrector(models.Model):
     event = models.ForeignKey(
@@ -174,6 +183,12 @@ STATUS_ORDER = [
     ApplicantStatusTypes.confirmed.value,
 ]
 
+# Position of each status in STATUS_ORDER
+STATUS_RANK = {status: rank for rank, status in enumerate(STATUS_ORDER)}
+
+# Name of each status, avoids going through the enum lookup
+STATUS_NAMES = {status.value: status.name for status in ApplicantStatusTypes}
+
 
 class Applicant(models.Model):
     """
@@ -190,116 +205,201 @@ class Applicant(models.Model):
     edition = models.ForeignKey(Edition, on_delete=models.CASCADE)
 
     # Wishes of the candidate
-    # TODO: Rename as assignation_event is deprecated
     assignation_wishes = models.ManyToManyField(
         Event, through='EventWish', related_name='applicants', blank=True
     )
 
-    # Wishes she is accepted to
-    # TODO: Deprecated (use wish-specific status)
-    assignation_event = models.ManyToManyField(
-        Event, related_name='assigned_applicants', blank=True
-    )
-
     # Review of the application
     labels = models.ManyToManyField(ApplicantLabel, blank=True)
 
     @property
     def status(self):
-        wishes_status = set(wish.status for wish in self.eventwish_set.all())
-
-        for wish_status in reversed(STATUS_ORDER):
-            if wish_status in wishes_status:
-                return wish_status
+        # Use the rank computed by the database if it has been annotated, see
+        # Applicant.with_status_rank
+        if hasattr(self, 'status_rank'):
+            if self.status_rank is None:
+                return ApplicantStatusTypes.incomplete.value
+
+            return STATUS_ORDER[self.status_rank]
+
+        return max(
+            (wish.status for wish in self.eventwish_set.all()),
+            key=STATUS_RANK.get,
+            default=ApplicantStatusTypes.incomplete.value,
+        )
 
-        return ApplicantStatusTypes.incomplete.value
+    @staticmethod
+    def with_status_rank(queryset):
+        """
+        Annotate a queryset of applicants with `status_rank`, the rank in
+        STATUS_ORDER of their status, computed by the database (None for
+        applicants without any wish). Applicant.status then reads it instead
+        of going through the wishes.
+        """
+        return queryset.annotate(
+            status_rank=Max(
+                Case(
+                    *(
+                        When(eventwish__status=status, then=Value(rank))
+                        for status, rank in STATUS_RANK.items()
+                    ),
+                    output_field=models.IntegerField(),
+                )
+            )
+        )
 
     def is_locked(self):
-        return EventWish.objects.filter(
-            ~Q(
-                status__in=[
-                    ApplicantStatusTypes.incomplete.value,
-                    ApplicantStatusTypes.rejected.value,
-                ]
-            ),
-            applicant=self,
-        ).exists()
+        return any(
+            wish.status
+            not in (
+                ApplicantStatusTypes.incomplete.value,
+                ApplicantStatusTypes.rejected.value,
+            )
+            for wish in self.eventwish_set.all()
+        )
 
     def has_rejected_choices(self):
-        return EventWish.objects.filter(
-            applicant=self, status=ApplicantStatusTypes.rejected.value
-        ).exists()
+        return any(
+            wish.status == ApplicantStatusTypes.rejected.value
+            for wish in self.eventwish_set.all()
+        )
 
     def has_non_rejected_choices(self):
-        return EventWish.objects.filter(
-            ~Q(status=ApplicantStatusTypes.rejected.value), applicant=self
-        ).exists()
+        return any(
+            wish.status != ApplicantStatusTypes.rejected.value
+            for wish in self.eventwish_set.all()
+        )
 
     def get_export_data(self):
         """
         Return an array of data to be converted to csv
         """
 
-        export_datas = OrderedDict()
+        export_datas = {}
         export_datas["Username"] = self.user.username
         export_datas["First name"] = self.user.first_name
         export_datas["Last name"] = self.user.last_name
         export_datas["Email"] = self.user.email
         export_datas["Edition"] = str(self.edition)
-        export_datas["Labels"] = str(self.labels)
+        export_datas["Labels"] = ', '.join(
+            str(label) for label in self.labels.all()
+        )
 
+        answers = self.get_answers_by_question()
         questions = self.edition.signup_form.question_list.all()
 
         for question in questions:
-            try:
-                answer = Answer.objects.get(applicant=self, question=question)
-                export_datas[str(question)] = str(answer)
-            except Answer.DoesNotExist:
+            answer = answers.get(question.id)
+
+            if answer is None:
                 export_datas[str(question)] = "(empty)"
+            else:
+                answer.question = question
+                export_datas[str(question)] = str(answer)
 
         return export_datas
 
+    @staticmethod
+    def get_export_fieldnames(queryset):
+        """
+        List the columns of the csv export of the applicants in `queryset`
+        """
+        fieldnames = [
+            "Username",
+            "First name",
+            "Last name",
+            "Email",
+            "Edition",
+            "Labels",
+        ]
+        forms = Form.objects.filter(edition__applicant__in=queryset)
+        questions = (
+            QuestionForForm.objects.filter(form__in=forms)
+            .select_related('question')
+            .order_by('form', 'order')
+        )
+
+        for joined in questions:
+            if str(joined.question) not in fieldnames:
+                fieldnames.append(str(joined.question))
+
+        return fieldnames
+
+    @staticmethod
+    def iter_export_rows(queryset):
+        """
+        Lazily generate the export data of the applicants in `queryset`
+        """
+        queryset = queryset.select_related(
+            'user', 'edition__signup_form'
+        ).prefetch_related(
+            'answers', 'labels', 'edition__signup_form__question_list'
+        )
+
+        for applicant in iter_queryset_by_chunks(queryset):
+            yield applicant.get_export_data()
+
+    def get_answers_by_question(self):
+        """
+        Returns a dict mapping question ids to the applicant's answers, fetched
+        with a single query (or from the prefetch cache of `answers`).
+
+        Callers iterating over questions attach them back to the answers so
+        that `answer.question` doesn't trigger an extra query.
+        """
+        return {answer.question_id: answer for answer in self.answers.all()}
+
     def get_ordered_answers(self):
         """
         Returns an ordered list of gcc.models.Answer for a given applicant
         """
+        answers = self.get_answers_by_question()
         questions = self.edition.signup_form.question_list.all().order_by(
             'questionforform__order'
         )
-        answers = []
+        ordered_answers = []
 
+        # we don't append optional questions that were not filled
         for question in questions:
-            try:
-                answer = Answer.objects.get(applicant=self, question=question)
-                answers.append(answer)
-            except Answer.DoesNotExist:
-                # we don't append optional questions that were not filled
-                pass
+            if question.id in answers:
+                answer = answers[question.id]
+                answer.question = question
+                ordered_answers.append(answer)
 
-        return answers
+        return ordered_answers
 
     def get_status_display(self):
-        return ApplicantStatusTypes(self.status).name
+        return STATUS_NAMES[self.status]
 
     def list_of_assignation_wishes(self):
-        return [event for event in self.assignation_wishes.all()]
+        return self.assignation_wishes.all()
 
-    def list_of_assignation_event(self):
-        return [event for event in self.assignation_event.all()]
-
-    def has_complete_application(self):
-        # TODO: optimize requests
+    def has_complete_application(self, edition=None):
+        """
+        Check if the applicant filled all the required fields of the form of
+        `edition`. Callers which already know the edition should pass it in to
+        avoid querying for the current one.
+        """
         if not self.user.has_complete_profile():
             return False
 
-        questions = Edition.current().signup_form.question_list.all()
+        if edition is None:
+            edition = Edition.current()
+
+        answers = self.get_answers_by_question()
+        questions = edition.signup_form.question_list.all()
         for question in questions:
-            try:
-                answer = Answer.objects.get(applicant=self, question=question)
-                if not answer.is_valid():
-                    return False
-            except Answer.DoesNotExist:
-                return question.finaly_required
+            if not question.finaly_required:
+                continue
+
+            answer = answers.get(question.id)
+
+            if answer is None:
+                return False
+
+            answer.question = question
+            if not answer.is_valid():
+                return False
 
         return True
 
@@ -309,6 +409,22 @@ class Applicant(models.Model):
                 wish.status = ApplicantStatusTypes.pending.value
                 wish.save()
 
+    @staticmethod
+    def status_counts_for(event):
+        """
+        Count the applicants to an event by the status of their wish, using a
+        single query. Returns a dict mapping a status to a number of
+        applicants, statuses without any applicant are missing.
+        """
+        # Clear the default ordering, which would be added to the GROUP BY
+        counts = (
+            EventWish.objects.filter(event=event)
+            .order_by()
+            .values('status')
+            .annotate(count=Count('pk'))
+        )
+        return {row['status']: row['count'] for row in counts}
+
     @staticmethod
     def incomplete_applicants_for(event):
         """
@@ -316,7 +432,7 @@ class Applicant(models.Model):
         """
         acceptable_wishes = EventWish.objects.filter(
             event=event, status=ApplicantStatusTypes.incomplete.value
-        )
+        ).select_related('applicant__user')
         return [wish.applicant for wish in acceptable_wishes]
 
     @staticmethod
@@ -327,7 +443,7 @@ class Applicant(models.Model):
         """
         acceptable_wishes = EventWish.objects.filter(
             event=event, status=ApplicantStatusTypes.selected.value
-        )
+        ).select_related('applicant__user')
         return [wish.applicant for wish in acceptable_wishes]
 
     @staticmethod
@@ -337,7 +453,7 @@ class Applicant(models.Model):
         """
         accepted_wishes = EventWish.objects.filter(
             event=event, status=ApplicantStatusTypes.accepted.value
-        )
+        ).select_related('applicant__user')
         return [wish.applicant for wish in accepted_wishes]
 
     @staticmethod
@@ -347,7 +463,7 @@ class Applicant(models.Model):
         """
         confirmed_wishes = EventWish.objects.filter(
             event=event, status=ApplicantStatusTypes.confirmed.value
-        )
+        ).select_related('applicant__user')
         return [wish.applicant for wish in confirmed_wishes]
 
     @staticmethod
@@ -357,7 +473,7 @@ class Applicant(models.Model):
         """
         acceptable_wishes = EventWish.objects.filter(
             event=event, status=ApplicantStatusTypes.rejected.value
-        )
+        ).select_related('applicant__user')
         return [wish.applicant for wish in acceptable_wishes]
 
     @staticmethod
@@ -369,10 +485,6 @@ class Applicant(models.Model):
         applicant, created = Applicant.objects.get_or_create(
             user=user, edition=edition
         )
-
-        if created:
-            applicant.save()
-
         return applicant
 
     def __str__(self):
@@ -410,6 +522,15 @@ class EventWish(models.Model):
     class Meta:
         ordering = ('order',)
         unique_together = (('applicant', 'event'),)
+        indexes = [
+            models.Index(
+                fields=['event', 'status'], name='gcc_eventwish_event_status'
+            ),
+            models.Index(
+                fields=['applicant', 'status'],
+                name='gcc_eventwish_appl_status',
+            ),
+        ]
 
 
 @ChoiceEnum.labels(str.capitalize)
@@ -465,6 +586,11 @@ class Question(models.Model):
     # Some extra constraints on the answer
     meta = JSONField(encoder=DjangoJSONEncoder, default=dict, null=True)
 
+    @cached_property
+    def choices(self):
+        """Mapping of the options of a multichoice question"""
+        return (self.meta or {}).get('choices', {})
+
     def __str__(self):
         ret = self.question
 
@@ -504,10 +630,7 @@ class Answer(models.Model):
 
     def __str__(self):
         if self.question.response_type == AnswerTypes.multichoice.value:
-            if str(self.response) not in self.question.meta['choices']:
-                return ''
-
-            return self.question.meta['choices'][str(self.response)]
+            return self.question.choices.get(str(self.response), '')
 
         return str(self.response)
 
@@ -516,10 +639,10 @@ class Answer(models.Model):
 
 
 class SubscriberEmail(models.Model):
-    email = models.EmailField()
+    email = models.EmailField(unique=True)
     date = models.DateTimeField(auto_now_add=True)
 
-    @property
+    @cached_property
     def unsubscribe_token(self):
         subscriber_id = str(self.id).encode()
         secret = settings.SECRET_KEY.encode()
@@ -532,8 +655,17 @@ class SubscriberEmail(models.Model):
             kwargs={'email': self.email, 'token': self.unsubscribe_token},
         )
 
+    @staticmethod
+    def get_export_fieldnames(queryset):
+        return ["Email", "Date Added", "Unsubscribe URL"]
+
+    @staticmethod
+    def iter_export_rows(queryset):
+        for subscriber in queryset.iterator(chunk_size=500):
+            yield subscriber.get_export_data()
+
     def get_export_data(self):
-        data = OrderedDict()
+        data = {}
         data["Email"] = self.email
         data["Date Added"] = self.date.strftime('%Y-%m-%d %H:%M:%S')
         data["Unsubscribe URL"] = self.get_unsubscribe_url
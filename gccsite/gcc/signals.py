@@ -0,0 +1,25 @@
+# Copyright (C) <2019> Association Prologin <association@prologin.org>
+# SPDX-License-Identifier: GPL-3.0+
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from centers.models import Center
+from gcc.models import Edition, Event, Sponsor
+from zinnia.models import Entry
+
+
+@receiver(post_save, sender=Center)
+@receiver(post_delete, sender=Center)
+@receiver(post_save, sender=Edition)
+@receiver(post_delete, sender=Edition)
+@receiver(post_save, sender=Event)
+@receiver(post_delete, sender=Event)
+@receiver(post_save, sender=Sponsor)
+@receiver(post_delete, sender=Sponsor)
+@receiver(post_save, sender=Entry)
+@receiver(post_delete, sender=Entry)
+def invalidate_homepage_cache(sender, **kwargs):
+    cache.delete(settings.GCC_HOMEPAGE_CACHE.key)
@@ -5,11 +5,13 @@ import sys
 import os
 from django.conf import settings
 from django.contrib import messages
+from django.db.models import Prefetch
 from django.contrib.staticfiles.storage import staticfiles_storage
 from django.http import Http404
 from django.http.response import JsonResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import RedirectView, TemplateView, View
 from prologin.email import send_email
@@ -57,25 +59,44 @@ class ApplicationReviewView(PermissionRequiredMixin, TemplateView):
         Extract the list of users who have an application this year and list
         their applications in the same object.
         """
-        event = get_object_or_404(Event, pk=kwargs['event'])
+        event = get_object_or_404(
+            Event.objects.select_related('center', 'edition'),
+            pk=kwargs['event'],
+        )
         applicants = Applicant.objects.filter(assignation_wishes=event)
-        applicants = applicants.prefetch_related(
+        applicants = applicants.select_related('user', 'edition__signup_form')
+        # Only fetch the fields of the users that are rendered by the template
+        applicants = applicants.only(
             'user',
-            'answers',
-            'answers__question',
-            'eventwish_set',
-            'eventwish_set__event',
+            'edition__signup_form',
+            'user__username',
+            'user__first_name',
+            'user__last_name',
+            'user__email',
+            'user__birthday',
+            'user__address',
+            'user__postal_code',
+            'user__city',
+            'user__country',
+        )
+        applicants = applicants.prefetch_related(
+            Prefetch(
+                'answers', queryset=Answer.objects.select_related('question')
+            ),
+            'eventwish_set__event__center',
             'labels',
         )
-        acceptable_applicants = Applicant.acceptable_applicants_for(event)
+        status_counts = Applicant.status_counts_for(event)
 
         # Group applicants by choice order
         grouped_applicants = dict()
 
         for applicant in applicants:
-            order = EventWish.objects.get(
-                applicant=applicant, event=event
-            ).order
+            order = next(
+                wish.order
+                for wish in applicant.eventwish_set.all()
+                if wish.event_id == event.pk
+            )
 
             if order not in grouped_applicants:
                 grouped_applicants[order] = []
@@ -102,14 +123,18 @@ class ApplicationReviewView(PermissionRequiredMixin, TemplateView):
                 'grouped_applicants': grouped_applicants,
                 'event': event,
                 'labels': ApplicantLabel.objects.all(),
-                'nb_acceptables': len(acceptable_applicants),
+                'nb_acceptables': status_counts.get(
+                    ApplicantStatusTypes.selected.value, 0
+                ),
+                'nb_accepted': status_counts.get(
+                    ApplicantStatusTypes.accepted.value, 0
+                ),
+                'nb_confirmed': status_counts.get(
+                    ApplicantStatusTypes.confirmed.value, 0
+                ),
             }
         )
 
-        context['nb_accepted'] = len(Applicant.accepted_applicants_for(event))
-        context['nb_confirmed'] = len(
-            Applicant.confirmed_applicants_for(event)
-        )
         context['nb_applicants'] = applicants.count()
 
         return context
@@ -259,17 +284,16 @@ class ApplicationAcceptSendView(PermissionRequiredMixin, RedirectView):
 class ApplicationRemoveLabelView(PermissionRequiredMixin, View):
     permission_required = 'gcc.can_edit_application_labels'
 
-    def get_permission_object(self):
+    @cached_property
+    def applicant(self):
         return get_object_or_404(Applicant, pk=self.kwargs['applicant'])
 
+    def get_permission_object(self):
+        return self.applicant
+
     def get(self, request, *args, **kwargs):
         try:
-            applicant = Applicant.objects.get(pk=kwargs['applicant'])
             label = ApplicantLabel.objects.get(pk=kwargs['label'])
-        except Applicant.DoesNotExist:
-            return JsonResponse(
-                {'status': 'error', 'reason': _('applicant does not exist')}
-            )
         except ApplicantLabel.DoesNotExist:
             return JsonResponse(
                 {'status': 'error', 'reason': _('label does not exist')}
@@ -280,29 +304,28 @@ class ApplicationRemoveLabelView(PermissionRequiredMixin, View):
                 {'status': 'error', 'reason': _('not allowed')}
             )
 
-        if label not in applicant.labels.all():
+        if not self.applicant.labels.filter(pk=label.pk).exists():
             return JsonResponse(
                 {'status': 'error', 'reason': 'label not applied'}
             )
 
-        applicant.labels.remove(label)
+        self.applicant.labels.remove(label)
         return JsonResponse({'status': 'ok'})
 
 
 class ApplicationAddLabelView(PermissionRequiredMixin, View):
     permission_required = 'gcc.can_edit_application_labels'
 
-    def get_permission_object(self):
+    @cached_property
+    def applicant(self):
         return get_object_or_404(Applicant, pk=self.kwargs['applicant'])
 
+    def get_permission_object(self):
+        return self.applicant
+
     def get(self, request, *args, **kwargs):
         try:
-            applicant = Applicant.objects.get(pk=kwargs['applicant'])
             label = ApplicantLabel.objects.get(pk=kwargs['label'])
-        except Applicant.DoesNotExist:
-            return JsonResponse(
-                {'status': 'error', 'reason': _('applicant does not exist')}
-            )
         except ApplicantLabel.DoesNotExist:
             return JsonResponse(
                 {'status': 'error', 'reason': _('label does not exist')}
@@ -313,12 +336,12 @@ class ApplicationAddLabelView(PermissionRequiredMixin, View):
                 {'status': 'error', 'reason': _('not allowed')}
             )
 
-        if label in applicant.labels.all():
+        if self.applicant.labels.filter(pk=label.pk).exists():
             return JsonResponse(
                 {'status': 'error', 'reason': 'label already applied'}
             )
 
-        applicant.labels.add(label)
+        self.applicant.labels.add(label)
         return JsonResponse({'status': 'ok'})
 
 
@@ -330,7 +353,9 @@ class UpdateWish(PermissionRequiredMixin, View):
 
     def get(self, request, *args, **kwargs):
         try:
-            wish = EventWish.objects.get(pk=kwargs['wish'])
+            wish = EventWish.objects.select_related('applicant').get(
+                pk=kwargs['wish']
+            )
             status = kwargs['status']
         except EventWish.DoesNotExist:
             return JsonResponse(
@@ -349,7 +374,9 @@ class UpdateWish(PermissionRequiredMixin, View):
         wish.status = status
         wish.save()
 
-        nb_acceptables = len(Applicant.acceptable_applicants_for(wish.event))
+        nb_acceptables = EventWish.objects.filter(
+            event=wish.event_id, status=ApplicantStatusTypes.selected.value
+        ).count()
         return JsonResponse(
             {
                 'status': 'ok',
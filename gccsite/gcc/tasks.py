@@ -0,0 +1,40 @@
+# Copyright (C) <2019> Association Prologin <association@prologin.org>
+# SPDX-License-Identifier: GPL-3.0+
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import send_mail
+from django.template.loader import get_template
+from django.utils import translation
+from django.utils.text import format_lazy
+from django.utils.translation import ugettext_lazy as _
+
+from gcc.models import Applicant
+from prologin.email import send_email
+
+
+@shared_task
+def send_subscribe_mail(email, unsubscribe_url, language):
+    """Sends the newsletter subscription confirmation"""
+    with translation.override(language):
+        send_email(
+            'gcc/mails/subscribe', email, {'unsubscribe_url': unsubscribe_url}
+        )
+
+
+@shared_task
+def send_application_mail(applicant_id, year, language):
+    """Sends the confirmation of a validated application"""
+    applicant = Applicant.objects.select_related('user').get(pk=applicant_id)
+
+    with translation.override(language):
+        send_mail(
+            format_lazy(
+                "[Girls Can Code!][{}] {}", year, _("Application confirmation")
+            ),
+            get_template('gcc/mails/application.body.text.html').render(
+                {'applicant': applicant}
+            ),
+            settings.DEFAULT_FROM_EMAIL,
+            [applicant.user.email],
+        )
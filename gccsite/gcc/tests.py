@@ -0,0 +1,202 @@
+# Copyright (C) <2019> Association Prologin <association@prologin.org>
+# SPDX-License-Identifier: GPL-3.0+
+
+from datetime import date, timedelta
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.utils import timezone
+
+from centers.models import Center
+from gcc.models import (
+    Answer,
+    AnswerTypes,
+    Applicant,
+    ApplicantStatusTypes,
+    Edition,
+    Event,
+    EventWish,
+    Form,
+    Question,
+    QuestionForForm,
+)
+from prologin.models import Gender
+
+
+class ApplicantStatusTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        now = timezone.now()
+        center = Center.objects.create(
+            name='Center', type=Center.Type.center.value
+        )
+        form = Form.objects.create(name='Form')
+        cls.edition = Edition.objects.create(year=2019, signup_form=form)
+        cls.events = [
+            Event.objects.create(
+                center=center,
+                edition=cls.edition,
+                signup_start=now - timedelta(days=10),
+                signup_end=now + timedelta(days=10),
+                event_start=now + timedelta(days=20 + i),
+                event_end=now + timedelta(days=21 + i),
+            )
+            for i in range(3)
+        ]
+
+        for i, statuses in enumerate(
+            [
+                [ApplicantStatusTypes.incomplete.value],
+                [
+                    ApplicantStatusTypes.rejected.value,
+                    ApplicantStatusTypes.pending.value,
+                ],
+                [
+                    ApplicantStatusTypes.rejected.value,
+                    ApplicantStatusTypes.rejected.value,
+                ],
+            ]
+        ):
+            user = get_user_model().objects.create(
+                id=i + 1, username='user{}'.format(i)
+            )
+            applicant = Applicant.objects.create(
+                user=user, edition=cls.edition
+            )
+
+            for order, (event, status) in enumerate(zip(cls.events, statuses)):
+                EventWish.objects.create(
+                    applicant=applicant,
+                    event=event,
+                    status=status,
+                    order=order + 1,
+                )
+
+    def test_wishes_helpers(self):
+        applicants = {
+            applicant.user.username: applicant
+            for applicant in Applicant.objects.select_related('user')
+        }
+
+        self.assertFalse(applicants['user0'].is_locked())
+        self.assertFalse(applicants['user0'].has_rejected_choices())
+        self.assertTrue(applicants['user0'].has_non_rejected_choices())
+
+        self.assertTrue(applicants['user1'].is_locked())
+        self.assertTrue(applicants['user1'].has_rejected_choices())
+        self.assertTrue(applicants['user1'].has_non_rejected_choices())
+
+        self.assertFalse(applicants['user2'].is_locked())
+        self.assertTrue(applicants['user2'].has_rejected_choices())
+        self.assertFalse(applicants['user2'].has_non_rejected_choices())
+
+    def test_status(self):
+        expected = {
+            'user0': ApplicantStatusTypes.incomplete.value,
+            'user1': ApplicantStatusTypes.pending.value,
+            'user2': ApplicantStatusTypes.rejected.value,
+        }
+
+        for applicant in Applicant.objects.select_related('user'):
+            self.assertEqual(
+                applicant.status, expected[applicant.user.username]
+            )
+
+        annotated = Applicant.with_status_rank(
+            Applicant.objects.select_related('user')
+        )
+
+        with self.assertNumQueries(1):
+            for applicant in annotated:
+                self.assertEqual(
+                    applicant.status, expected[applicant.user.username]
+                )
+
+    def test_status_counts(self):
+        with self.assertNumQueries(1):
+            counts = Applicant.status_counts_for(self.events[0])
+
+        self.assertEqual(
+            counts,
+            {
+                ApplicantStatusTypes.incomplete.value: 1,
+                ApplicantStatusTypes.rejected.value: 2,
+            },
+        )
+
+    def test_wishes_helpers_use_prefetch(self):
+        applicants = list(Applicant.objects.prefetch_related('eventwish_set'))
+
+        with self.assertNumQueries(0):
+            for applicant in applicants:
+                applicant.status
+                applicant.is_locked()
+                applicant.has_rejected_choices()
+                applicant.has_non_rejected_choices()
+
+
+class ApplicantAnswersTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        form = Form.objects.create(name='Form')
+        cls.edition = Edition.objects.create(year=2019, signup_form=form)
+        cls.questions = [
+            Question.objects.create(
+                question='Question {}'.format(i),
+                response_type=AnswerTypes.string.value,
+                finaly_required=True,
+            )
+            for i in range(3)
+        ]
+
+        for order, question in enumerate(cls.questions):
+            QuestionForForm.objects.create(
+                question=question, form=form, order=order + 1
+            )
+
+        user = get_user_model().objects.create(
+            id=1,
+            username='user',
+            first_name='First',
+            last_name='Last',
+            email='user@example.org',
+            gender=Gender.female.value,
+            birthday=date(2004, 1, 1),
+            phone='0123456789',
+            address='1 rue de la Paix',
+            postal_code='75000',
+            city='Paris',
+            country='France',
+        )
+        cls.applicant = Applicant.objects.create(
+            user=user, edition=cls.edition
+        )
+
+    def test_complete_application(self):
+        applicant = Applicant.objects.select_related('user').get()
+
+        for question in self.questions:
+            self.assertFalse(applicant.has_complete_application(self.edition))
+            Answer.objects.create(
+                applicant=applicant, question=question, response='answer'
+            )
+
+        # One query for the answers and one for the questions
+        with self.assertNumQueries(2):
+            self.assertTrue(applicant.has_complete_application(self.edition))
+
+    def test_ordered_answers(self):
+        for question in reversed(self.questions):
+            Answer.objects.create(
+                applicant=self.applicant, question=question, response='answer'
+            )
+
+        applicant = Applicant.objects.select_related(
+            'edition__signup_form'
+        ).get()
+
+        with self.assertNumQueries(2):
+            answers = applicant.get_ordered_answers()
+            self.assertEqual(
+                [answer.question for answer in answers], self.questions
+            )
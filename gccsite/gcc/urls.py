@@ -1,7 +1,6 @@
 # Copyright (C) <2018> Association Prologin <association@prologin.org>
 # SPDX-License-Identifier: GPL-3.0+
 
-from django.contrib import admin
 from django.contrib.auth.decorators import login_required
 from django.http import HttpResponse
 from django.urls import include, path
@@ -105,12 +104,4 @@ urlpatterns = [
         'editions/<int:year>/', views.EditionsView.as_view(), name='editions'
     ),
     path('tutorials/', views.TutorialsView.as_view(), name='tutorials'),
-    # Remove after february 2020: candidates received a wrong url
-    path(
-        'confirm/<int:wish>/',
-        views.ApplicationConfirmVenueView.as_view(),
-        name='confirm',
-    ),
-    # Admin panel
-    path('admin/', admin.site.urls),
 ]
@@ -6,17 +6,17 @@ from datetime import datetime
 
 from django.conf import settings
 from django.contrib import auth, messages
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import get_object_or_404
 from django.urls import reverse, reverse_lazy
-from django.utils import timezone
-from django.utils.text import format_lazy
+from django.utils import timezone, translation
+from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 from django.views.generic import RedirectView, TemplateView
 from django.views.generic.detail import DetailView
 from django.views.generic.edit import FormView
-from django.template.loader import get_template
-from django.core.mail import send_mail
 
 from gcc.forms import (
     ApplicationWishesForm,
@@ -32,10 +32,59 @@ from gcc.models import (
     Sponsor,
     SubscriberEmail,
 )
-from prologin.email import send_email
+from gcc.tasks import send_application_mail, send_subscribe_mail
 from rules.contrib.views import PermissionRequiredMixin
 from zinnia.models import Entry
 
+
+def get_current_edition(request):
+    """
+    Gets current edition, the query is only issued once per request and the
+    result is stored on the request itself
+    """
+    if not hasattr(request, '_gcc_current_edition'):
+        request._gcc_current_edition = Edition.current()
+
+    return request._gcc_current_edition
+
+
+def get_homepage_context():
+    """
+    Gets the data displayed on the homepage, it is the same for every visitor
+    so it is cached for a short duration and cleared by gcc.signals
+    """
+
+    def compute():
+        now = timezone.now()
+        last_edition = Edition.current()
+        return {
+            'last_edition': last_edition,
+            'sponsors': list(
+                Sponsor.objects.active().only('name', 'logo', 'site')
+            ),
+            'articles': list(
+                Entry.published.prefetch_related('authors').all()[
+                    : settings.HOMEPAGE_ARTICLES
+                ]
+            ),
+            'events': list(
+                Event.objects.filter(
+                    signup_start__lt=now,
+                    signup_end__gt=now,
+                    edition=last_edition,
+                )
+                .select_related('center')
+                .order_by('event_start')
+            ),
+        }
+
+    return cache.get_or_set(
+        settings.GCC_HOMEPAGE_CACHE.key,
+        compute,
+        settings.GCC_HOMEPAGE_CACHE.duration,
+    )
+
+
 # Editions
 
 
@@ -63,46 +112,36 @@ class IndexView(FormView):
     success_url = reverse_lazy("gcc:index")
 
     def form_valid(self, form):
-        instance, created = SubscriberEmail.objects.get_or_create(
-            email=form.cleaned_data['email']
-        )
-
-        if created:
-            messages.add_message(
-                self.request, messages.SUCCESS, _('Subscription succeeded')
-            )
-            send_email(
-                'gcc/mails/subscribe',
-                instance.email,
-                {'unsubscribe_url': instance.get_unsubscribe_url},
-            )
-        else:
+        try:
+            with transaction.atomic():
+                instance = SubscriberEmail.objects.create(
+                    email=form.cleaned_data['email']
+                )
+        except IntegrityError:
             messages.add_message(
                 self.request,
                 messages.WARNING,
                 _('Subscription failed: already subscribed'),
             )
+        else:
+            messages.add_message(
+                self.request, messages.SUCCESS, _('Subscription succeeded')
+            )
+            send_subscribe_mail.delay(
+                instance.email,
+                instance.get_unsubscribe_url,
+                translation.get_language(),
+            )
 
         return super().form_valid(form)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        articles = Entry.published.prefetch_related('authors').all()[
-            : settings.HOMEPAGE_ARTICLES
-        ]
-        context.update(
-            {
-                'last_edition': Edition.objects.latest(),
-                'sponsors': list(Sponsor.objects.active()),
-                'articles': articles,
-            }
+        context.update(get_homepage_context())
+        # Shuffled on each request, the cached list is left untouched
+        context['sponsors'] = random.sample(
+            context['sponsors'], len(context['sponsors'])
         )
-        context['events'] = Event.objects.filter(
-            signup_start__lt=timezone.now(),
-            signup_end__gt=timezone.now(),
-            edition=context['last_edition'],
-        ).order_by('event_start')
-        random.shuffle(context['sponsors'])
         return context
 
 
@@ -123,41 +162,39 @@ class LearnMoreView(FormView):
     success_url = reverse_lazy("gcc:learn_more")
 
     def form_valid(self, form):
-        instance, created = SubscriberEmail.objects.get_or_create(
-            email=form.cleaned_data['email']
-        )
-
-        if created:
-            messages.add_message(
-                self.request, messages.SUCCESS, _('Subscription succeeded')
-            )
-            send_email(
-                'gcc/mails/subscribe',
-                instance.email,
-                {'unsubscribe_url': instance.get_unsubscribe_url},
-            )
-        else:
+        try:
+            with transaction.atomic():
+                instance = SubscriberEmail.objects.create(
+                    email=form.cleaned_data['email']
+                )
+        except IntegrityError:
             messages.add_message(
                 self.request,
                 messages.WARNING,
                 _('Subscription failed: already subscribed'),
             )
+        else:
+            messages.add_message(
+                self.request, messages.SUCCESS, _('Subscription succeeded')
+            )
+            send_subscribe_mail.delay(
+                instance.email,
+                instance.get_unsubscribe_url,
+                translation.get_language(),
+            )
 
         return super().form_valid(form)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
+        homepage_context = get_homepage_context()
         context.update(
             {
-                'last_edition': Edition.objects.latest(),
+                'last_edition': homepage_context['last_edition'],
+                'events': homepage_context['events'],
                 'SITE_HOST': settings.SITE_HOST,
             }
         )
-        context['events'] = Event.objects.filter(
-            signup_start__lt=timezone.now(),
-            signup_end__gt=timezone.now(),
-            edition=context['last_edition'],
-        ).order_by('event_start')
         return context
 
 
@@ -205,19 +242,48 @@ class ApplicationSummaryView(PermissionRequiredMixin, DetailView):
     permission_required = 'users.edit'
     success_url = reverse_lazy("gcc:summary")
 
+    def get_queryset(self):
+        # Only load the fields displayed on the profile
+        return (
+            super()
+            .get_queryset()
+            .only(
+                'first_name',
+                'last_name',
+                'phone',
+                'email',
+                'birthday',
+                'address',
+                'postal_code',
+                'city',
+                'country',
+                'date_joined',
+                'is_active',
+            )
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         shown_user = context[self.context_object_name]
+        current_edition = get_current_edition(self.request)
+        applicant = get_object_or_404(
+            Applicant.objects.select_related(
+                'user', 'edition__signup_form'
+            ).prefetch_related('eventwish_set__event__center'),
+            user=shown_user,
+            edition=current_edition,
+        )
 
         context.update(
             {
                 'shown_user': shown_user,
-                'current_edition': Edition.current(),
-                'applicant': get_object_or_404(
-                    Applicant, user=shown_user, edition=Edition.current()
-                ),
-                'has_applied_to_current': Edition.current().user_has_applied(
-                    shown_user
+                'current_edition': current_edition,
+                'applicant': applicant,
+                # The lookup above would have failed if the user didn't apply
+                'has_applied_to_current': True,
+                'subscription_is_open': current_edition.subscription_is_open(),
+                'has_complete_application': applicant.has_complete_application(
+                    current_edition
                 ),
             }
         )
@@ -236,6 +302,10 @@ class ApplicationValidationView(PermissionRequiredMixin, DetailView):
     template_name = 'gcc/application/validation.html'
     permission_required = 'users.edit'
 
+    def get_queryset(self):
+        # The shown user is only needed for the permission check
+        return super().get_queryset().only('is_active')
+
     def get(self, request, *args, **kwargs):
         result = super().get(request, *args, **kwargs)
         if not self.object.is_active and not self.request.user.is_staff:
@@ -248,7 +318,14 @@ class ApplicationValidationView(PermissionRequiredMixin, DetailView):
             Applicant, user=self.request.user, edition=self.kwargs['edition']
         )
         context = super().get_context_data(**kwargs)
-        context['applicant'] = applicant
+        context.update(
+            {
+                'applicant': applicant,
+                'has_complete_application': applicant.has_complete_application(
+                    get_current_edition(self.request)
+                ),
+            }
+        )
         return context
 
     def get_success_url(self):
@@ -257,13 +334,16 @@ class ApplicationValidationView(PermissionRequiredMixin, DetailView):
         )
 
     def post(self, request, *args, **kwargs):
-        super().get(request, *args, **kwargs)
+        self.object = self.get_object()
+        if not self.object.is_active and not self.request.user.is_staff:
+            raise Http404()
 
         applicant = get_object_or_404(
             Applicant, user=self.request.user, edition=kwargs['edition']
         )
+        current_edition = get_current_edition(request)
 
-        if not applicant.has_complete_application():
+        if not applicant.has_complete_application(current_edition):
             messages.add_message(
                 request,
                 messages.ERROR,
@@ -282,23 +362,13 @@ class ApplicationValidationView(PermissionRequiredMixin, DetailView):
                     'You should receive a confirmation email soon.'
                 ),
             )
-            send_mail(
-                format_lazy(
-                    "[Girls Can Code!][{}] {}",
-                    Edition.current().year,
-                    _("Application confirmation"),
-                ),
-                get_template('gcc/mails/application.body.text.html').render(
-                    {'applicant': applicant}
-                ),
-                settings.DEFAULT_FROM_EMAIL,
-                [self.request.user.email]
+            send_application_mail.delay(
+                applicant.pk,
                 # TODO Change this when settings.GCC_EDITION is up
+                current_edition.year,
+                translation.get_language(),
             )
 
-        if not self.object.is_active and not self.request.user.is_staff:
-            raise Http404()
-
         return HttpResponseRedirect(
             reverse(
                 'gcc:application_summary', kwargs={'pk': self.request.user.pk}
@@ -311,14 +381,18 @@ class ApplicationFormView(FormView):
     form_class = CombinedApplicantUserForm
 
     def dispatch(self, request, *args, **kwargs):
+        # Resolve the edition once, other hooks rely on self.edition
+        self.edition = get_object_or_404(Edition, year=kwargs['edition'])
+
         # Redirect if already validated for this year.
         if request.user.is_anonymous:
             return super().dispatch(request, *args, **kwargs)
 
-        edition = get_object_or_404(Edition, year=kwargs['edition'])
-        applicant = Applicant.for_user_and_edition(self.request.user, edition)
+        self.applicant = Applicant.for_user_and_edition(
+            self.request.user, self.edition
+        )
 
-        if applicant.is_locked():
+        if self.applicant.is_locked():
             messages.add_message(
                 request,
                 messages.ERROR,
@@ -338,10 +412,13 @@ class ApplicationFormView(FormView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['applicant'] = get_object_or_404(
-            Applicant,
-            edition__year=self.kwargs['edition'],
-            user=self.request.user,
+        context.update(
+            {
+                'applicant': self.applicant,
+                'has_complete_application': (
+                    self.applicant.has_complete_application(self.edition)
+                ),
+            }
         )
         return context
 
@@ -353,19 +430,12 @@ class ApplicationFormView(FormView):
         kwargs = super().get_form_kwargs()
         kwargs['instance'] = self.request.user
         kwargs['user'] = self.request.user
-        kwargs['edition'] = get_object_or_404(
-            Edition, year=self.kwargs['edition']
-        )
+        kwargs['edition'] = self.edition
         return kwargs
 
     def get_success_url(self):
         return reverse(
-            'gcc:application_wishes',
-            kwargs={
-                'edition': get_object_or_404(
-                    Edition, year=self.kwargs['edition']
-                )
-            },
+            'gcc:application_wishes', kwargs={'edition': self.edition}
         )
 
     def form_valid(self, form):
@@ -378,11 +448,14 @@ class ApplicationWishesView(FormView, PermissionRequiredMixin):
     form_class = ApplicationWishesForm
     permission_required = 'gcc.can_edit_own_application'
 
+    def dispatch(self, request, *args, **kwargs):
+        # Resolve the edition once, other hooks rely on self.edition
+        self.edition = get_object_or_404(Edition, year=kwargs['edition'])
+        return super().dispatch(request, *args, **kwargs)
+
     def get_permission_object(self):
         return get_object_or_404(
-            Applicant,
-            user=self.request.user,
-            edition__year=self.kwargs['edition'],
+            Applicant, user=self.request.user, edition=self.edition
         )
 
     def get_success_url(self):
@@ -395,9 +468,7 @@ class ApplicationWishesView(FormView, PermissionRequiredMixin):
         kwargs = super().get_form_kwargs()
         kwargs.update(
             {
-                'edition': get_object_or_404(
-                    Edition, year=self.kwargs['edition']
-                ),
+                'edition': self.edition,
                 'user': self.request.user,
             }
         )
@@ -406,49 +477,54 @@ class ApplicationWishesView(FormView, PermissionRequiredMixin):
     def get_initial(self):
         event_wishes = EventWish.objects.filter(
             applicant__user=self.request.user,
-            applicant__edition__year=self.kwargs['edition'],
-        )
-        initials = {}
-
-        for wish in event_wishes:
-            assert wish.order in [1, 2, 3]
-            field_name = 'priority' + str(wish.order)
-            initials[field_name] = wish.event.pk
+            applicant__edition=self.edition,
+            order__in=[1, 2, 3],
+        ).values_list('order', 'event_id')
 
-        return initials
+        return {
+            'priority' + str(order): event_id
+            for order, event_id in event_wishes
+        }
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context['events'] = Event.objects.filter(
-            signup_start__lt=timezone.now(),
-            signup_end__gt=timezone.now(),
-            edition=self.kwargs['edition'],
-        ).order_by('event_start')
+        now = timezone.now()
+        context['events'] = (
+            Event.objects.filter(
+                signup_start__lt=now, signup_end__gt=now, edition=self.edition
+            )
+            .select_related('center')
+            .order_by('event_start')
+        )
         return context
 
     def form_valid(self, form):
-        edition = get_object_or_404(Edition, year=self.kwargs['edition'])
-        form.save(self.request.user, edition)
+        form.save(self.request.user, self.edition)
         return super().form_valid(form)
 
 
 class ApplicationConfirmVenueView(PermissionRequiredMixin, RedirectView):
     permission_required = 'users.edit'
 
-    def get_permission_object(self):
+    @cached_property
+    def wish(self):
         return get_object_or_404(
-            EventWish, pk=self.kwargs['wish']
-        ).applicant.user
+            EventWish.objects.select_related('applicant__user'),
+            pk=self.kwargs['wish'],
+        )
+
+    def get_permission_object(self):
+        return self.wish.applicant.user
 
     def get_redirect_url(self, *args, **kwargs):
-        wish = get_object_or_404(EventWish, pk=kwargs['wish'])
         return reverse(
-            'gcc:application_summary', kwargs={'pk': wish.applicant.user.pk}
+            'gcc:application_summary',
+            kwargs={'pk': self.wish.applicant.user_id},
         )
 
     def get(self, request, *args, **kwargs):
         if self.has_permission():
-            wish = get_object_or_404(EventWish, pk=kwargs['wish'])
+            wish = self.wish
 
             if wish.status == ApplicantStatusTypes.accepted.value:
                 wish.status = ApplicantStatusTypes.confirmed.value
@@ -49,7 +49,9 @@ class Command(BaseCommand):
         for subscriber_data in data['subscribers']:
             fields = subscriber_data['fields']
 
-            if not models.SubscriberEmail.objects.filter(email=fields['mail']):
+            if not models.SubscriberEmail.objects.filter(
+                email=fields['mail']
+            ).exists():
                 models.SubscriberEmail(
                     email=fields['mail'], date=fields['created']
                 ).save()
@@ -366,11 +368,9 @@ class Command(BaseCommand):
                 order += 1
                 event = events[choice]
 
-                wish_exists = bool(
-                    models.EventWish.objects.filter(
-                        applicant=applicant, event=event
-                    )
-                )
+                wish_exists = models.EventWish.objects.filter(
+                    applicant=applicant, event=event
+                ).exists()
 
                 if not wish_exists:
                     models.EventWish(
@@ -418,7 +418,8 @@ class Command(BaseCommand):
                     )
                     event_wish.save()
 
-                applicant.assignation_event.add(event_wish.event)
+                event_wish.status = models.ApplicantStatusTypes.accepted.value
+                event_wish.save()
 
         #       _        _
         #   ___| |_ __ _| |_ _   _ ___
@@ -179,6 +179,7 @@ OAUTH_CLIENT_ID = 'gcc'
 
 # Cache durations and keys
 CacheSetting = namedtuple('CacheSetting', 'key duration')
+GCC_HOMEPAGE_CACHE = CacheSetting('gcc.homepage', 60)
 
 
 # Celery
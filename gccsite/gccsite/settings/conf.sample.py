@@ -27,20 +27,28 @@ OAUTH_SECRET = 'CHANGEME'
 # Database
 # https://docs.djangoproject.com/en/1.7/ref/settings/#databases
 DATABASES = {
-    'default': {'ENGINE': 'django.db.backends.postgresql', 'NAME': 'gcc'}
+    'default': {
+        'ENGINE': 'django.db.backends.postgresql',
+        'NAME': 'gcc',
+        # Keep connections open between requests
+        'CONN_MAX_AGE': 60,
+    }
 }
 
 # Logging
 # https://docs.djangoproject.com/en/1.7/topics/logging/
+# Run with GCC_LOGLEVEL=DEBUG to also log every SQL query
+
+LOG_LEVEL = os.environ.get('GCC_LOGLEVEL', 'INFO')
 
 LOGGING = {
     'version': 1,
     'disable_existing_loggers': False,
     'handlers': {
-        'console': {'level': 'DEBUG', 'class': 'logging.StreamHandler'}
+        'console': {'level': LOG_LEVEL, 'class': 'logging.StreamHandler'}
     },
     'loggers': {
-        '': {'handlers': ['console'], 'level': 'DEBUG', 'propagate': True}
+        '': {'handlers': ['console'], 'level': LOG_LEVEL, 'propagate': True}
     },
 }
 
@@ -6,11 +6,7 @@ from django.contrib import admin
 from django.urls import path, include
 from django.views.generic.base import TemplateView
 
-import debug_toolbar
-
 urlpatterns = [
-    # Debug toolbar
-    path('__debug__/', include(debug_toolbar.urls)),
     # GCC
     path('', include('gcc.urls', namespace='gcc')),
     # GCC
@@ -31,8 +27,12 @@ urlpatterns = [
 ]
 
 if settings.DEBUG:
+    import debug_toolbar
+
     urlpatterns.extend(
         [
+            # Debug toolbar
+            path('__debug__/', include(debug_toolbar.urls)),
             path('e/400/', TemplateView.as_view(template_name='400.html')),
             path('e/403/', TemplateView.as_view(template_name='403.html')),
             path('e/404/', TemplateView.as_view(template_name='404.html')),
@@ -1,6 +1,8 @@
 # Copyright (C) <2019> Association Prologin <association@prologin.org>
 # SPDX-License-Identifier: GPL-3.0+
 
+import copy
+
 from crispy_forms import layout
 from crispy_forms.helper import FormHelper
 from crispy_forms.layout import Layout
@@ -17,6 +19,34 @@ from prologin.utils.forms import ConfirmDangerMixin
 
 User = get_user_model()
 
+# The layout of UserProfileForm never changes, build it once: a row with two
+# columns of fields
+PROFILE_FORM_LAYOUT = Layout(
+    layout.Div(
+        layout.Div(
+            'first_name',
+            'last_name',
+            'gender',
+            'email',
+            'birthday',
+            'address',
+            css_class="col-md-6",
+        ),
+        layout.Div(
+            'postal_code',
+            'city',
+            'country',
+            'phone',
+            'school_stage',
+            'allow_mailing',
+            'timezone',
+            'preferred_locale',
+            css_class="col-md-6",
+        ),
+        css_class="row",
+    )
+)
+
 
 class UserProfileForm(forms.ModelForm):
     class Meta:
@@ -62,17 +92,9 @@ class UserProfileForm(forms.ModelForm):
             ("", _("Other or prefer not to tell")),
         ]
 
-        self.helper = FormHelper(self)
+        self.helper = FormHelper()
         self.helper.form_tag = False
-        # input, input, ...
-        self.helper[:6].wrap_together(layout.Div, css_class="col-md-6")
-        # COL, input, input...
-        self.helper[1:].wrap_together(layout.Div, css_class="col-md-6")
-        # COL, COL
-        self.helper[:].wrap_together(layout.Div, css_class="row")
-
-    def clean(self):
-        return super().clean()
+        self.helper.layout = copy.deepcopy(PROFILE_FORM_LAYOUT)
 
 
 class PasswordResetForm(forms.Form):
@@ -10,7 +10,7 @@ from django.urls import reverse
 from django.utils.functional import cached_property
 from django.utils.translation import ugettext_lazy as _
 
-from gcc.models import Applicant, ApplicantStatusTypes
+from gcc.models import STATUS_RANK, Applicant, ApplicantStatusTypes
 from prologin.models import (
     AddressableModel,
     ChoiceEnum,
@@ -94,11 +94,12 @@ class GCCUser(AbstractUser, AddressableModel):
 
     @cached_property
     def participations_count(self):
-        applicants = Applicant.objects.filter(user=self)
-        return sum(
-            (applicant.status == ApplicantStatusTypes.confirmed.value)
-            for applicant in applicants
+        applicants = Applicant.with_status_rank(
+            Applicant.objects.filter(user=self)
         )
+        return applicants.filter(
+            status_rank=STATUS_RANK[ApplicantStatusTypes.confirmed.value]
+        ).count()
 
     @property
     def unsubscribe_token(self):